@@ -5,12 +5,33 @@ Multi-API intelligence gathering tool for Telegram reconnaissance
 GitHub: https://github.com/yourusername/TelegramOSINT-Kit
 """
 
-import subprocess
 import sys
 import json
 import os
-from typing import Optional, Dict, Any, List
+import atexit
+import base64
+import hashlib
+import time
+import socket
+import sqlite3
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, List, Tuple
 from datetime import datetime
+from urllib.parse import urlencode, urlsplit
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime; http.client, ssl and concurrent.futures are slow to load
+    import http.client
+    import ssl
+    from concurrent.futures import Future
+
+try:
+    import orjson  # Optional: faster JSON parsing and serialization
+except ImportError:
+    orjson = None
 
 # Color codes for terminal output
 class Colors:
@@ -26,34 +47,113 @@ class Colors:
     PURPLE = '\033[35m'
     GREY = '\033[90m'
     RED = '\033[91m'
+    LIGHT_PURPLE = '\033[38;5;141m'
+    BLUE_PURPLE = '\033[38;5;105m'
+    DEEP_BLUE = '\033[38;5;27m'
+    MAGENTA = '\033[38;5;170m'
+    VIOLET = '\033[38;5;135m'
+    ROYAL_PURPLE = '\033[38;5;93m'
 
 # Configuration
 CONFIG_FILE = os.path.expanduser("~/.tg_osint_config.json")
 USAGE_FILE = os.path.expanduser("~/.tg_osint_usage.json")
+CACHE_FILE = os.path.expanduser("~/.tg_osint_cache.db")
+CACHE_TTL = 7 * 24 * 3600  # One week
+VOLATILE_CACHE_TTL = 10 * 60  # Presence, membership and stories change quickly
+USAGE_FLUSH_INTERVAL = 5  # Seconds between usage file writes during a burst of paid calls
+
+# RapidAPI hosts
+SCRAPER_HOST = 'telegram-scraper-api.p.rapidapi.com'
+CHANNEL_HOST = 'telegram-channel.p.rapidapi.com'
+
+# API endpoints (query strings are built with urlencode)
+BOT_ID_URL = "https://botsarchive.com/getBotID.php"
+CHANNEL_INFO_URL = "https://telegram-channel.p.rapidapi.com/channel/info"
+ENTITY_SEARCH_URL = "https://telegram-scraper-api.p.rapidapi.com/entity/search"
+GET_PARTICIPANT_URL = "https://telegram-scraper-api.p.rapidapi.com/entity/get-participant"
+FETCH_ENTITY_URL = "https://telegram-scraper-api.p.rapidapi.com/entity/fetch"
+FETCH_FULL_USER_URL = "https://telegram-scraper-api.p.rapidapi.com/user/full"
+FETCH_FULL_CHANNEL_URL = "https://telegram-scraper-api.p.rapidapi.com/entity/fullchannel"
+SEARCH_BY_PHONE_URL = "https://telegram-scraper-api.p.rapidapi.com/user/search-by-phone"
+FETCH_ONLINE_URL = "https://telegram-scraper-api.p.rapidapi.com/entity/online"
+FETCH_STORIES_URL = "https://telegram-scraper-api.p.rapidapi.com/stories/fetch"
+
+_PRETTY_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False)
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+# Fallbacks for text UTF-8 can't hold (lone surrogates from strings cut mid-emoji)
+_PRETTY_ASCII_ENCODER = json.JSONEncoder(indent=2)
+_COMPACT_ASCII_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # Let the stdlib handle what orjson rejects (NaN, huge ints)
+    return json.loads(data)
+
+def json_dumps(data: Any, pretty: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=(orjson.OPT_INDENT_2 if pretty else 0) | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    encoder = _PRETTY_ENCODER if pretty else _COMPACT_ENCODER
+    try:
+        return encoder.encode(data).encode('utf-8')
+    except UnicodeEncodeError:
+        # \u escapes round-trip through json_loads unchanged
+        encoder = _PRETTY_ASCII_ENCODER if pretty else _COMPACT_ASCII_ENCODER
+        return encoder.encode(data).encode('ascii')
+
+def _atomic_write_json(path: str, data: Any):
+    """Write JSON to a temp file and rename it over path, so a crash never leaves a partial file"""
+    tmp = path + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with open(fd, 'wb') as f:
+        f.write(json_dumps(data))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    # Set restrictive permissions
+    os.chmod(path, 0o600)
 
 class ConfigManager:
     """Manage API key configuration"""
     
+    __slots__ = ('_config', '_dirty')
+    
     def __init__(self):
-        self.config = self.load_config()
+        self._config = None
+        self._dirty = False
+        atexit.register(self.save_config)
+    
+    @property
+    def config(self) -> Dict:
+        """Configuration, loaded from file on first access"""
+        if self._config is None:
+            self._config = self.load_config()
+        return self._config
     
     def load_config(self) -> Dict:
         """Load configuration from file"""
-        if os.path.exists(CONFIG_FILE):
-            try:
-                with open(CONFIG_FILE, 'r') as f:
-                    return json.load(f)
-            except:
-                return {}
-        return {}
+        try:
+            with open(CONFIG_FILE, 'rb') as f:
+                data = json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        # Valid JSON that isn't an object is as unusable as a corrupt file
+        return data if isinstance(data, dict) else {}
     
     def save_config(self):
-        """Save configuration to file"""
+        """Save configuration to file if it changed"""
+        if not self._dirty:
+            return
         try:
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(self.config, f, indent=2)
-            # Set restrictive permissions
-            os.chmod(CONFIG_FILE, 0o600)
+            _atomic_write_json(CONFIG_FILE, self.config)
+            self._dirty = False
         except Exception as e:
             print_status(f"Failed to save config: {e}", "error")
     
@@ -63,7 +163,10 @@ class ConfigManager:
     
     def set_api_key(self, key_name: str, value: str):
         """Set API key in config"""
+        if self.config.get(key_name) == value:
+            return
         self.config[key_name] = value
+        self._dirty = True
         self.save_config()
     
     def has_keys(self) -> bool:
@@ -71,54 +174,95 @@ class ConfigManager:
         return bool(self.config.get('rapidapi_channel_key') or 
                    self.config.get('rapidapi_scraper_key'))
 
+def _month_key() -> Tuple[str, float]:
+    """Return the current month as YYYY-MM and the timestamp the next month starts at"""
+    now = datetime.now()
+    next_month = datetime(now.year + now.month // 12, now.month % 12 + 1, 1)
+    return now.strftime('%Y-%m'), next_month.timestamp()
+
+# Month key for usage tracking, recomputed only once the month is over
+_current_month, _month_ends = _month_key()
+
+def current_month() -> str:
+    """Return the current month as YYYY-MM"""
+    global _current_month, _month_ends
+    if time.time() >= _month_ends:
+        _current_month, _month_ends = _month_key()
+    return _current_month
+
 class UsageTracker:
     """Track API usage for paid endpoints"""
     
+    __slots__ = ('limits', '_usage', '_dirty', '_lock', '_last_flush')
+    
     def __init__(self):
         self.limits = {
             'telegram_scraper': 15  # Monthly limit
         }
-        self.usage = self.load_usage()
+        self._usage = None
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._last_flush = 0.0
+        atexit.register(self.save_usage)
+    
+    @property
+    def usage(self) -> Dict:
+        """Usage data, loaded from file on first access and reset when the month rolls over"""
+        if self._usage is None:
+            self._usage = self.load_usage()
+        elif self._usage.get('month') != current_month():
+            self._usage = self.reset_usage()
+            self._dirty = True
+        return self._usage
+    
+    @usage.setter
+    def usage(self, value: Dict):
+        self._usage = value
+        self._dirty = True
     
     def load_usage(self) -> Dict:
         """Load usage data from file"""
-        if os.path.exists(USAGE_FILE):
-            try:
-                with open(USAGE_FILE, 'r') as f:
-                    data = json.load(f)
-                    # Reset if new month
-                    if data.get('month') != datetime.now().strftime('%Y-%m'):
-                        return self.reset_usage()
-                    return data
-            except:
-                return self.reset_usage()
-        return self.reset_usage()
+        try:
+            with open(USAGE_FILE, 'rb') as f:
+                data = json_loads(f.read())
+        except (OSError, ValueError):
+            return self.reset_usage()
+        # Reset if the file holds something other than an object, or a previous month
+        if not isinstance(data, dict) or data.get('month') != current_month():
+            return self.reset_usage()
+        return data
     
     def reset_usage(self) -> Dict:
         """Reset usage for new month"""
         return {
-            'month': datetime.now().strftime('%Y-%m'),
+            'month': current_month(),
             'telegram_scraper': 0
         }
     
     def save_usage(self):
-        """Save usage data to file"""
+        """Save usage data to file if it changed"""
+        if not self._dirty:
+            return
         try:
-            with open(USAGE_FILE, 'w') as f:
-                json.dump(self.usage, f, indent=2)
+            _atomic_write_json(USAGE_FILE, self.usage)
+            self._dirty = False
+            self._last_flush = time.monotonic()
         except Exception as e:
             print_status(f"Failed to save usage data: {e}", "warning")
     
-    def can_use(self, api_name: str) -> bool:
-        """Check if API can be used"""
+    def can_use(self, api_name: str, calls: int = 1) -> bool:
+        """Check if API can be used for the given number of calls"""
         if api_name not in self.limits:
             return True
-        return self.usage.get(api_name, 0) < self.limits[api_name]
+        return self.usage.get(api_name, 0) + calls <= self.limits[api_name]
     
     def increment(self, api_name: str):
-        """Increment usage counter"""
-        self.usage[api_name] = self.usage.get(api_name, 0) + 1
-        self.save_usage()
+        """Increment usage counter (persisted at most every few seconds and at exit)"""
+        with self._lock:
+            self.usage[api_name] = self.usage.get(api_name, 0) + 1
+            self._dirty = True
+            if time.monotonic() - self._last_flush >= USAGE_FLUSH_INTERVAL:
+                self.save_usage()
     
     def get_remaining(self, api_name: str) -> str:
         """Get remaining calls for API"""
@@ -129,9 +273,7 @@ class UsageTracker:
         remaining = limit - used
         return f"{remaining}/{limit}"
 
-def print_banner():
-    """Display Telegram ASCII art banner"""
-    banner = """
+BANNER_ART = """
 ....................................................................................................
 ....................................................................................................
 ....................................................................................................
@@ -177,100 +319,535 @@ def print_banner():
 ....................................................................................................
 ....................................................................................................
 """
-    print(f"{Colors.OKCYAN}{banner}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{'='*100}{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.PURPLE}                           TELEGRAM OSINT KIT{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.GREY}                  Multi-API Intelligence Gathering Platform{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.HEADER}{'='*100}{Colors.ENDC}\n")
+
+# Static screens are built once at import and written in a single call
+_BANNER_BLOB = "".join([
+    f"{Colors.OKCYAN}{BANNER_ART}{Colors.ENDC}\n",
+    f"{Colors.BOLD}{Colors.HEADER}{'='*100}{Colors.ENDC}\n",
+    f"{Colors.BOLD}{Colors.PURPLE}                           TELEGRAM OSINT KIT{Colors.ENDC}\n",
+    f"{Colors.BOLD}{Colors.GREY}                  Multi-API Intelligence Gathering Platform{Colors.ENDC}\n",
+    f"{Colors.BOLD}{Colors.HEADER}{'='*100}{Colors.ENDC}\n\n",
+])
+
+_MAIN_MENU_PREFIX = f"\n{Colors.BOLD}{Colors.OKBLUE}[MAIN MENU]{Colors.ENDC}\n"
+_MAIN_MENU_NO_KEYS = f"{Colors.BOLD}{Colors.WARNING}⚠️  API Keys Not Configured{Colors.ENDC}\n"
+_MAIN_MENU_SUFFIX = "".join([
+    "\n",
+    f"  {Colors.OKGREEN}1.{Colors.ENDC} Free Search (All Free APIs)    {Colors.GREY}[Unlimited]{Colors.ENDC}\n",
+    f"  {Colors.OKGREEN}2.{Colors.ENDC} Paid Operations Menu            {Colors.GREY}[Requires API keys]{Colors.ENDC}\n",
+    f"\n{Colors.BOLD}{Colors.OKBLUE}[CONFIGURATION]{Colors.ENDC}\n\n",
+    f"  {Colors.OKGREEN}C.{Colors.ENDC} Configure API Keys\n",
+    f"  {Colors.OKGREEN}V.{Colors.ENDC} View Configuration Status\n",
+    f"\n{Colors.BOLD}{Colors.OKBLUE}[UTILITIES]{Colors.ENDC}\n\n",
+    f"  {Colors.OKGREEN}U.{Colors.ENDC} View Usage Stats\n",
+    f"  {Colors.OKGREEN}R.{Colors.ENDC} Reset Usage Counter\n",
+    f"  {Colors.OKGREEN}X.{Colors.ENDC} Clear Response Cache\n",
+    f"  {Colors.OKGREEN}0.{Colors.ENDC} Exit\n\n",
+])
+
+_PAID_MENU_PREFIX = f"\n{Colors.BOLD}{Colors.PURPLE}[PAID OPERATIONS MENU]{Colors.ENDC}\n"
+_PAID_MENU_SUFFIX = "".join([
+    "\n",
+    f"  {Colors.PURPLE}1.{Colors.ENDC} Check Participant Status     {Colors.GREY}(Check if user is in channel/group){Colors.ENDC}\n",
+    f"  {Colors.PURPLE}2.{Colors.ENDC} Fetch Entity by Username     {Colors.GREY}(Get user/channel by @username){Colors.ENDC}\n",
+    f"  {Colors.PURPLE}3.{Colors.ENDC} Fetch Full User Info         {Colors.GREY}(Complete user profile){Colors.ENDC}\n",
+    f"  {Colors.PURPLE}4.{Colors.ENDC} Fetch Full Channel Info      {Colors.GREY}(Complete channel details){Colors.ENDC}\n",
+    f"  {Colors.PURPLE}5.{Colors.ENDC} Search User by Phone         {Colors.GREY}(Find user by phone number){Colors.ENDC}\n",
+    f"  {Colors.PURPLE}6.{Colors.ENDC} Fetch Online Users           {Colors.GREY}(Get online members of group){Colors.ENDC}\n",
+    f"  {Colors.PURPLE}7.{Colors.ENDC} Fetch Stories                {Colors.GREY}(Get user/channel stories){Colors.ENDC}\n",
+    f"  {Colors.PURPLE}8.{Colors.ENDC} Search Entities              {Colors.GREY}(Global search for channels/users){Colors.ENDC}\n",
+    f"  {Colors.PURPLE}9.{Colors.ENDC} Bulk Investigate             {Colors.GREY}(Options 3, 4, 6 and 7 at once - up to 4 calls){Colors.ENDC}\n",
+    f"\n  {Colors.OKGREEN}0.{Colors.ENDC} Back to Main Menu\n\n",
+])
+
+@lru_cache(maxsize=64)
+def _encode_screen(text: str, encoding: str, errors: str) -> bytes:
+    """Encode a screen fragment once per stream encoding"""
+    return text.encode(encoding, errors)
+
+def _write_screen(*parts: str):
+    """Write screen fragments to stdout as one block of pre-encoded bytes"""
+    out = sys.stdout
+    buffer = getattr(out, 'buffer', None)
+    if buffer is None:
+        # Redirected to a text-only stream
+        out.write("".join(parts))
+        return
+    encoding = out.encoding or 'utf-8'
+    errors = out.errors or 'strict'
+    data = b"".join([_encode_screen(part, encoding, errors) for part in parts])
+    # Keep ordering with anything still queued in the text layer
+    out.flush()
+    buffer.write(data)
+
+def print_banner():
+    """Display Telegram ASCII art banner"""
+    _write_screen(_BANNER_BLOB)
 
 def print_main_menu(tracker: UsageTracker, config: ConfigManager):
     """Display main menu"""
-    print(f"\n{Colors.BOLD}{Colors.OKBLUE}[MAIN MENU]{Colors.ENDC}")
-    
     if config.has_keys():
-        print(f"{Colors.BOLD}Paid API Status:{Colors.ENDC} {tracker.get_remaining('telegram_scraper')} remaining this month")
+        status_line = f"{Colors.BOLD}Paid API Status:{Colors.ENDC} {tracker.get_remaining('telegram_scraper')} remaining this month\n"
     else:
-        print(f"{Colors.BOLD}{Colors.WARNING}⚠️  API Keys Not Configured{Colors.ENDC}")
-    
-    print()
-    print(f"  {Colors.OKGREEN}1.{Colors.ENDC} Free Search (All Free APIs)    {Colors.GREY}[Unlimited]{Colors.ENDC}")
-    print(f"  {Colors.OKGREEN}2.{Colors.ENDC} Paid Operations Menu            {Colors.GREY}[Requires API keys]{Colors.ENDC}")
-    
-    print(f"\n{Colors.BOLD}{Colors.OKBLUE}[CONFIGURATION]{Colors.ENDC}\n")
-    print(f"  {Colors.OKGREEN}C.{Colors.ENDC} Configure API Keys")
-    print(f"  {Colors.OKGREEN}V.{Colors.ENDC} View Configuration Status")
-    
-    print(f"\n{Colors.BOLD}{Colors.OKBLUE}[UTILITIES]{Colors.ENDC}\n")
-    print(f"  {Colors.OKGREEN}U.{Colors.ENDC} View Usage Stats")
-    print(f"  {Colors.OKGREEN}R.{Colors.ENDC} Reset Usage Counter")
-    print(f"  {Colors.OKGREEN}0.{Colors.ENDC} Exit\n")
+        status_line = _MAIN_MENU_NO_KEYS
+    _write_screen(_MAIN_MENU_PREFIX, status_line, _MAIN_MENU_SUFFIX)
 
 def print_paid_menu(tracker: UsageTracker):
     """Display paid operations menu"""
-    print(f"\n{Colors.BOLD}{Colors.PURPLE}[PAID OPERATIONS MENU]{Colors.ENDC}")
-    print(f"{Colors.BOLD}Remaining calls:{Colors.ENDC} {tracker.get_remaining('telegram_scraper')}\n")
-    
-    print(f"  {Colors.PURPLE}1.{Colors.ENDC} Check Participant Status     {Colors.GREY}(Check if user is in channel/group){Colors.ENDC}")
-    print(f"  {Colors.PURPLE}2.{Colors.ENDC} Fetch Entity by Username     {Colors.GREY}(Get user/channel by @username){Colors.ENDC}")
-    print(f"  {Colors.PURPLE}3.{Colors.ENDC} Fetch Full User Info         {Colors.GREY}(Complete user profile){Colors.ENDC}")
-    print(f"  {Colors.PURPLE}4.{Colors.ENDC} Fetch Full Channel Info      {Colors.GREY}(Complete channel details){Colors.ENDC}")
-    print(f"  {Colors.PURPLE}5.{Colors.ENDC} Search User by Phone         {Colors.GREY}(Find user by phone number){Colors.ENDC}")
-    print(f"  {Colors.PURPLE}6.{Colors.ENDC} Fetch Online Users           {Colors.GREY}(Get online members of group){Colors.ENDC}")
-    print(f"  {Colors.PURPLE}7.{Colors.ENDC} Fetch Stories                {Colors.GREY}(Get user/channel stories){Colors.ENDC}")
-    print(f"  {Colors.PURPLE}8.{Colors.ENDC} Search Entities              {Colors.GREY}(Global search for channels/users){Colors.ENDC}")
-    print(f"\n  {Colors.OKGREEN}0.{Colors.ENDC} Back to Main Menu\n")
+    remaining_line = f"{Colors.BOLD}Remaining calls:{Colors.ENDC} {tracker.get_remaining('telegram_scraper')}\n"
+    _write_screen(_PAID_MENU_PREFIX, remaining_line, _PAID_MENU_SUFFIX)
+
+_STATUS_PREFIXES = {
+    "success": f"{Colors.OKGREEN}[+]{Colors.ENDC}",
+    "error": f"{Colors.FAIL}[!]{Colors.ENDC}",
+    "warning": f"{Colors.WARNING}[*]{Colors.ENDC}",
+    "paid": f"{Colors.PURPLE}[$]{Colors.ENDC}",
+    "free": f"{Colors.OKGREEN}[FREE]{Colors.ENDC}",
+    "info": f"{Colors.OKCYAN}[i]{Colors.ENDC}",
+}
+
+# Worker threads collect their status lines here instead of printing out of order
+_STATUS_CAPTURE = threading.local()
 
 def print_status(message: str, status: str = "info"):
     """Print formatted status messages"""
-    if status == "success":
-        print(f"{Colors.OKGREEN}[+]{Colors.ENDC} {message}")
-    elif status == "error":
-        print(f"{Colors.FAIL}[!]{Colors.ENDC} {message}")
-    elif status == "warning":
-        print(f"{Colors.WARNING}[*]{Colors.ENDC} {message}")
-    elif status == "paid":
-        print(f"{Colors.PURPLE}[$]{Colors.ENDC} {message}")
-    elif status == "free":
-        print(f"{Colors.OKGREEN}[FREE]{Colors.ENDC} {message}")
+    prefix = _STATUS_PREFIXES.get(status, _STATUS_PREFIXES["info"])
+    line = f"{prefix} {message}\n"
+    captured = getattr(_STATUS_CAPTURE, 'lines', None)
+    if captured is not None:
+        captured.append(line)
+    else:
+        sys.stdout.write(line)
+
+def _status_captured() -> bool:
+    """True when running as a concurrent lookup whose status lines are printed later"""
+    return getattr(_STATUS_CAPTURE, 'lines', None) is not None
+
+def _write_json(data: Any, color: str, indent: int):
+    """Write colored JSON to stdout, streaming bytes instead of building one big string"""
+    out = sys.stdout
+    buffer = getattr(out, 'buffer', None)
+    if buffer is None or indent != 2:
+        # Redirected to a text-only stream, or a non-default indent
+        json_str = json.dumps(data, indent=indent, ensure_ascii=False)
+        out.write(f"{color}{json_str}{Colors.ENDC}\n")
+        return
+    
+    encoding = out.encoding or 'utf-8'
+    out.flush()
+    buffer.write(color.encode())
+    if orjson is not None and encoding.lower().replace('-', '') == 'utf8':
+        buffer.write(json_dumps(data))
     else:
-        print(f"{Colors.OKCYAN}[i]{Colors.ENDC} {message}")
+        for chunk in _PRETTY_ENCODER.iterencode(data):
+            buffer.write(chunk.encode(encoding, errors='replace'))
+    buffer.write(f"{Colors.ENDC}\n".encode())
+    buffer.flush()
 
 def print_json(data: Dict[Any, Any], indent: int = 2):
     """Pretty print JSON data with colors"""
-    json_str = json.dumps(data, indent=indent, ensure_ascii=False)
-    print(f"{Colors.GREY}{json_str}{Colors.ENDC}")
+    _write_json(data, Colors.GREY, indent)
 
 def print_json_colored(data: Dict[Any, Any], color: str, indent: int = 2):
     """Pretty print JSON data with specific color"""
-    json_str = json.dumps(data, indent=indent, ensure_ascii=False)
-    print(f"{color}{json_str}{Colors.ENDC}")
+    _write_json(data, color, indent)
 
-def curl_request(url: str, headers: Optional[Dict[str, str]] = None) -> Optional[Dict[Any, Any]]:
-    """Execute curl command and return JSON response"""
-    cmd = ["curl", "-s", "-X", "GET"]
-    
-    if headers:
-        for key, value in headers.items():
-            cmd.extend(["-H", f"{key}: {value}"])
-    
-    cmd.append(url)
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections reused across API calls"""
+    
+    def __init__(self, maxsize: int = 16, timeout: int = 15, dns_ttl: int = 300):
+        self.maxsize = maxsize  # Idle connections kept per host
+        self.timeout = timeout
+        self.dns_ttl = dns_ttl
+        self._idle: Dict[Tuple[str, str], List['http.client.HTTPConnection']] = {}
+        self._dns: Dict[Tuple[str, int], Tuple[float, List[Tuple]]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context: Optional['ssl.SSLContext'] = None
+    
+    def _get_ssl_context(self) -> 'ssl.SSLContext':
+        """Shared TLS context; http.client would otherwise reload the CA store per connection"""
+        import ssl
+        with self._lock:
+            if self._ssl_context is None:
+                context = ssl.create_default_context()
+                context.set_alpn_protocols(['http/1.1'])
+                self._ssl_context = context
+            return self._ssl_context
+    
+    def _resolve(self, host: str, port: int) -> List[Tuple]:
+        """Resolve host, caching the answer for dns_ttl seconds"""
+        key = (host, port)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._dns.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+        infos = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        with self._lock:
+            self._dns[key] = (now + self.dns_ttl, infos)
+        return infos
+    
+    def _create_connection(self, address: Tuple[str, int], timeout: Any = None,
+                           source_address: Optional[Tuple[str, int]] = None) -> socket.socket:
+        """Drop-in for socket.create_connection that uses the DNS cache"""
+        host, port = address
+        error: Optional[OSError] = None
+        for _, _, _, _, sockaddr in self._resolve(host, port):
+            try:
+                return socket.create_connection(sockaddr[:2], timeout, source_address)
+            except OSError as e:
+                error = e
+        # Every cached address failed, resolve again next time
+        with self._lock:
+            self._dns.pop((host, port), None)
+        raise error or OSError(f"No addresses for {host}")
+    
+    def _new_connection(self, scheme: str, host: str, port: Optional[int]) -> 'http.client.HTTPConnection':
+        # Deferred with ssl and urllib.request, the network stack is only loaded on the first request
+        import http.client
+        if scheme == 'https':
+            conn = http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self._get_ssl_context())
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=self.timeout)
+        # TLS still verifies against the hostname, only the TCP connect uses the cached address
+        conn._create_connection = self._create_connection
+        return conn
+    
+    def _connect(self, scheme: str, host: str, port: Optional[int]) -> 'http.client.HTTPConnection':
+        """Open a new connection, tunnelling through the environment proxy if set"""
+        from urllib.request import getproxies, proxy_bypass
+        proxies = getproxies()
+        # ALL_PROXY applies when no scheme-specific proxy is set, as it did with curl
+        proxy = proxies.get(scheme) or proxies.get('all')
+        if not proxy or proxy_bypass(host):
+            return self._new_connection(scheme, host, port)
+        
+        proxy_url = urlsplit(proxy if '://' in proxy else f"http://{proxy}")
+        if proxy_url.scheme != 'http':
+            # Refuse rather than silently bypass the proxy (OPSEC)
+            raise ValueError(f"Unsupported proxy scheme: {proxy_url.scheme}")
+        tunnel_headers = {}
+        if proxy_url.username:
+            credentials = f"{proxy_url.username}:{proxy_url.password or ''}".encode()
+            tunnel_headers['Proxy-Authorization'] = f"Basic {base64.b64encode(credentials).decode()}"
+        conn = self._new_connection(scheme, proxy_url.hostname, proxy_url.port or 8080)
+        conn.set_tunnel(host, port, headers=tunnel_headers)
+        return conn
+    
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, bytes]:
+        """Send a GET request and return (status, body)"""
+        parts = urlsplit(url)
+        pool_key = (parts.scheme, parts.netloc)
+        path = f"{parts.path or '/'}?{parts.query}" if parts.query else (parts.path or '/')
+        # Large channel/member payloads compress well, ask for gzip
+        request_headers = {'Accept': '*/*', 'Accept-Encoding': 'gzip'}
+        if headers:
+            request_headers.update(headers)
+        
+        while True:
+            with self._lock:
+                idle = self._idle.get(pool_key)
+                conn = idle.pop() if idle else None
+            reused = conn is not None
+            if conn is None:
+                conn = self._connect(parts.scheme, parts.hostname, parts.port)
+            
+            try:
+                conn.request('GET', path, headers=request_headers)
+                response = conn.getresponse()
+                body = response.read()
+            except ConnectionError:
+                conn.close()
+                if reused:
+                    # Server dropped an idle keep-alive connection, retry on a fresh one
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            
+            if response.will_close:
+                conn.close()
+            else:
+                with self._lock:
+                    idle = self._idle.setdefault(pool_key, [])
+                    if len(idle) < self.maxsize:
+                        idle.append(conn)
+                        conn = None
+                if conn is not None:
+                    conn.close()
+            if response.getheader('Content-Encoding', '').lower() == 'gzip':
+                import gzip
+                body = gzip.decompress(body)
+            return response.status, body
+
+    def warm(self, url: str):
+        """Open a connection to url's host ahead of time, so the next request skips DNS, TCP and TLS setup"""
+        parts = urlsplit(url)
+        pool_key = (parts.scheme, parts.netloc)
+        with self._lock:
+            if self._idle.get(pool_key):
+                return
+        conn = None
+        try:
+            conn = self._connect(parts.scheme, parts.hostname, parts.port)
+            conn.connect()
+        except Exception:
+            # Best effort, the real request reconnects and reports any error
+            if conn is not None:
+                conn.close()
+            return
+        with self._lock:
+            idle = self._idle.setdefault(pool_key, [])
+            if len(idle) < self.maxsize:
+                idle.append(conn)
+                conn = None
+        if conn is not None:
+            conn.close()
+    
+    def close(self):
+        """Close all idle connections"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+_POOL = ConnectionPool()
+atexit.register(_POOL.close)
+
+class ResponseCache:
+    """Cache successful API responses in memory (LRU) and in SQLite (TTL)"""
+    
+    def __init__(self, path: str = CACHE_FILE, ttl: int = CACHE_TTL, maxsize: int = 512):
+        self.path = path
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._memory: OrderedDict = OrderedDict()  # key -> (expires, data)
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        """Hash the endpoint and headers into a cache key"""
+        raw = url + "|" + json.dumps(headers or {}, sort_keys=True)
+        return hashlib.sha1(raw.encode()).hexdigest()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database on first use (caller holds _db_lock)"""
+        if self._db is None:
+            # Create the file with restrictive permissions, SQLite reuses them for the WAL
+            os.close(os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600))
+            db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("CREATE TABLE IF NOT EXISTS cache(key TEXT PRIMARY KEY, val BLOB, exp REAL)")
+            db.execute("DELETE FROM cache WHERE exp <= ?", (time.time(),))
+            self._db = db
+            atexit.register(self.close)
+        return self._db
+    
+    def close(self):
+        """Close the cache database"""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+    
+    def get(self, key: str) -> Optional[Dict[Any, Any]]:
+        """Return cached data, or None if missing or expired"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._memory.move_to_end(key)
+                    return entry[1]
+                del self._memory[key]
+        
+        try:
+            with self._db_lock:
+                row = self._connect().execute(
+                    "SELECT val, exp FROM cache WHERE key = ? AND exp > ?", (key, now)).fetchone()
+            if row is None:
+                return None
+            data = json_loads(row[0])
+        except (OSError, sqlite3.Error, ValueError) as e:
+            print_status(f"Failed to read cache: {e}", "warning")
+            return None
+        self._remember(key, row[1], data)
+        return data
+    
+    def put(self, key: str, data: Dict[Any, Any], ttl: Optional[int] = None):
+        """Store data in both tiers"""
+        expires = time.time() + (self.ttl if ttl is None else ttl)
+        self._remember(key, expires, data)
+        # Best effort: a failed disk write must never lose a response that was already fetched
+        try:
+            val = json_dumps(data, pretty=False)
+            with self._db_lock:
+                self._connect().execute(
+                    "INSERT OR REPLACE INTO cache(key, val, exp) VALUES (?, ?, ?)", (key, val, expires))
+        except (OSError, sqlite3.Error, ValueError, TypeError) as e:
+            print_status(f"Failed to write cache: {e}", "warning")
+    
+    def _remember(self, key: str, expires: float, data: Dict[Any, Any]):
+        with self._lock:
+            self._memory[key] = (expires, data)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.maxsize:
+                self._memory.popitem(last=False)
+    
+    def clear(self) -> int:
+        """Drop all cached responses, return number of entries removed"""
+        with self._lock:
+            self._memory.clear()
+        try:
+            with self._db_lock:
+                return self._connect().execute("DELETE FROM cache").rowcount
+        except (OSError, sqlite3.Error) as e:
+            print_status(f"Failed to clear cache: {e}", "error")
+            return 0
+
+_CACHE = ResponseCache()
+
+class SingleFlight:
+    """Coalesce concurrent calls with the same key into one execution"""
     
+    def __init__(self):
+        self._calls: Dict[str, 'Future'] = {}
+        self._lock = threading.Lock()
+    
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Run fn once per key at a time, return (result, shared)"""
+        from concurrent.futures import Future
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            return future.result(), True
+        
+        try:
+            result = fn()
+            future.set_result(result)
+            return result, False
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+_INFLIGHT = SingleFlight()
+
+def _fetch_json(url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[Optional[Dict[Any, Any]], Optional[int]]:
+    """Execute GET request over the shared connection pool, return (JSON response, HTTP status)"""
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=15)
-        if result.returncode == 0 and result.stdout:
+        status, body = _POOL.get(url, headers)
+        if body:
             try:
-                return json.loads(result.stdout)
-            except json.JSONDecodeError:
-                return {"raw_response": result.stdout}
+                return json_loads(body), status
+            except ValueError:
+                return {"raw_response": body.decode('utf-8', errors='replace')}, status
         else:
-            print_status(f"Curl error: {result.stderr}", "error")
-            return None
-    except subprocess.TimeoutExpired:
+            print_status(f"Empty response (HTTP {status})", "error")
+            return None, status
+    except socket.timeout:
         print_status("Request timed out", "error")
-        return None
+        return None, None
     except Exception as e:
         print_status(f"Error: {str(e)}", "error")
-        return None
+        return None, None
+
+def cached_request(url: str, headers: Optional[Dict[str, str]] = None, ttl: Optional[int] = None) -> Tuple[Optional[Dict[Any, Any]], bool]:
+    """Execute GET request through the response cache, return (JSON response, from_cache)"""
+    key = ResponseCache.make_key(url, headers)
+    cached = _CACHE.get(key)
+    if cached is not None:
+        return cached, True
+    
+    def fetch() -> Optional[Dict[Any, Any]]:
+        result, status = _fetch_json(url, headers)
+        # Only cache successful JSON objects/arrays, never API errors or bare scalars
+        if (isinstance(result, (dict, list)) and result and status is not None
+                and 200 <= status < 300 and 'raw_response' not in result):
+            _CACHE.put(key, result, ttl)
+        return result
+    
+    # Identical requests already in flight share one network call
+    return _INFLIGHT.do(key, fetch)
+
+@lru_cache(maxsize=None)
+def _scraper_headers(rapidapi_key: str) -> Dict[str, str]:
+    """Build Telegram Scraper API headers once per key"""
+    return {'x-rapidapi-host': SCRAPER_HOST, 'x-rapidapi-key': rapidapi_key}
+
+@lru_cache(maxsize=None)
+def _channel_headers(rapidapi_key: str) -> Dict[str, str]:
+    """Build Telegram Channel API headers once per key"""
+    return {'x-rapidapi-host': CHANNEL_HOST, 'x-rapidapi-key': rapidapi_key}
+
+def _run_captured(label: str, fn: Callable[..., Any], *args: Any) -> Tuple[Any, List[str]]:
+    """Run a lookup in a worker thread, returning (result, status lines) instead of printing"""
+    lines: List[str] = []
+    _STATUS_CAPTURE.lines = lines
+    try:
+        return fn(*args), lines
+    except Exception as e:
+        print_status(f"{label} failed: {str(e)}", "error")
+        return None, lines
+    finally:
+        _STATUS_CAPTURE.lines = None
+
+def _future_result(future: 'Future') -> Optional[Dict[Any, Any]]:
+    """Print a concurrent lookup's status lines from the calling thread and return its result"""
+    result, lines = future.result()
+    sys.stdout.write("".join(lines))
+    return result
+
+def _build_url(endpoint: str, **params: Any) -> str:
+    """Append URL-encoded query parameters to an endpoint"""
+    return f"{endpoint}?{urlencode(params)}"
+
+def _strip_at(name: str) -> str:
+    """Remove a single leading '@' (str.removeprefix needs Python 3.9)"""
+    return name[1:] if name.startswith('@') else name
+
+def _parse_limit(text: str, default: int = 10) -> int:
+    """Parse a result count, falling back to default on empty or invalid input"""
+    if not text:
+        return default
+    try:
+        limit = int(text)
+    except ValueError:
+        limit = 0
+    if limit < 1:
+        print_status(f"Invalid number of results, using {default}", "warning")
+        return default
+    return limit
+
+# Box-drawing borders for section headers
+BOX_WIDTH = 79
+BOX_TOP = "╔" + "═" * BOX_WIDTH + "╗"
+BOX_BOTTOM = "╚" + "═" * BOX_WIDTH + "╝"
+
+@lru_cache(maxsize=None)
+def _box_block(title: str, color: str) -> str:
+    """Build the colored lines of a section header box once per title/color"""
+    edge = f"{Colors.BOLD}{color}"
+    padding = ' ' * (BOX_WIDTH - 1 - len(title))
+    return (
+        f"{edge}{BOX_TOP}{Colors.ENDC}\n"
+        f"{edge}║{Colors.ENDC} {Colors.BOLD}{title}{Colors.ENDC}{padding}{edge}║{Colors.ENDC}\n"
+        f"{edge}{BOX_BOTTOM}{Colors.ENDC}\n"
+    )
+
+def print_box(title: str, color: str):
+    """Print a section header box"""
+    _write_screen(_box_block(title, color))
 
 # ============================================================================
 # FREE API FUNCTIONS
@@ -282,206 +859,138 @@ def get_bot_id(username: str) -> Optional[Dict[Any, Any]]:
         username = f'@{username}'
     
     print_status(f"Bot ID Lookup: {Colors.BOLD}{username}{Colors.ENDC}", "free")
-    url = f"https://botsarchive.com/getBotID.php?username={username}"
+    url = _build_url(BOT_ID_URL, username=username)
     
-    return curl_request(url)
+    return cached_request(url)[0]
 
 def get_channel_info_free(channel: str, rapidapi_key: str) -> Optional[Dict[Any, Any]]:
     """Get Telegram channel info from Telegram Channel API [FREE]"""
-    channel = channel.lstrip('@')
+    channel = _strip_at(channel)
     
     print_status(f"Channel Info: {Colors.BOLD}@{channel}{Colors.ENDC}", "free")
-    url = f"https://telegram-channel.p.rapidapi.com/channel/info?channel={channel}"
+    url = _build_url(CHANNEL_INFO_URL, channel=channel)
     
-    headers = {
-        'x-rapidapi-host': 'telegram-channel.p.rapidapi.com',
-        'x-rapidapi-key': rapidapi_key
-    }
+    headers = _channel_headers(rapidapi_key)
     
-    return curl_request(url, headers)
+    return cached_request(url, headers)[0]
 
 def entity_search_free(query: str, rapidapi_key: str, limit: int = 10) -> Optional[Dict[Any, Any]]:
     """Search for entities using Telegram Scraper [FREE]"""
     print_status(f"Entity Search: {Colors.BOLD}{query}{Colors.ENDC}", "free")
-    url = f"https://telegram-scraper-api.p.rapidapi.com/entity/search?q={query}&limit={limit}"
+    url = _build_url(ENTITY_SEARCH_URL, q=query, limit=limit)
     
-    headers = {
-        'x-rapidapi-host': 'telegram-scraper-api.p.rapidapi.com',
-        'x-rapidapi-key': rapidapi_key
-    }
+    headers = _scraper_headers(rapidapi_key)
     
-    return curl_request(url, headers)
+    return cached_request(url, headers)[0]
 
 # ============================================================================
 # PAID API FUNCTIONS (Telegram Scraper)
 # ============================================================================
 
-def check_participant_status(peer: str, participant: str, rapidapi_key: str, tracker: UsageTracker) -> Optional[Dict[Any, Any]]:
-    """Check if participant is in a chat [PAID]"""
+def _paid_get(url: str, headers: Dict[str, str], tracker: UsageTracker, ttl: Optional[int] = None) -> Optional[Dict[Any, Any]]:
+    """GET a paid endpoint, charging quota only for fresh network calls"""
+    cached = _CACHE.get(ResponseCache.make_key(url, headers))
+    if cached is not None:
+        print_status("Served from cache - no API call used", "paid")
+        return cached
+    
     if not tracker.can_use('telegram_scraper'):
         print_status(f"Monthly limit reached ({tracker.limits['telegram_scraper']} calls).", "error")
         return None
     
-    peer = peer.lstrip('@')
-    participant = participant.lstrip('@')
-    print_status(f"Checking if @{participant} is in @{peer}", "paid")
-    url = f"https://telegram-scraper-api.p.rapidapi.com/entity/get-participant?peer={peer}&participant={participant}"
-    
-    headers = {
-        'x-rapidapi-host': 'telegram-scraper-api.p.rapidapi.com',
-        'x-rapidapi-key': rapidapi_key
-    }
-    
-    result = curl_request(url, headers)
-    if result:
+    result, from_cache = cached_request(url, headers, ttl)
+    if result and from_cache:
+        print_status("Served from cache - no API call used", "paid")
+    elif result:
         tracker.increment('telegram_scraper')
-        print_status(f"API call recorded. Remaining: {tracker.get_remaining('telegram_scraper')}", "paid")
+        if _status_captured():
+            # Concurrent lookups finish out of order, the caller reports the remaining count once
+            print_status("API call recorded", "paid")
+        else:
+            print_status(f"API call recorded. Remaining: {tracker.get_remaining('telegram_scraper')}", "paid")
     return result
 
+def check_participant_status(peer: str, participant: str, rapidapi_key: str, tracker: UsageTracker) -> Optional[Dict[Any, Any]]:
+    """Check if participant is in a chat [PAID]"""
+    peer = _strip_at(peer)
+    participant = _strip_at(participant)
+    print_status(f"Checking if @{participant} is in @{peer}", "paid")
+    url = _build_url(GET_PARTICIPANT_URL, peer=peer, participant=participant)
+    return _paid_get(url, _scraper_headers(rapidapi_key), tracker, VOLATILE_CACHE_TTL)
+
 def fetch_entity_by_username(peer: str, rapidapi_key: str, tracker: UsageTracker) -> Optional[Dict[Any, Any]]:
     """Fetch entity by username [PAID]"""
-    if not tracker.can_use('telegram_scraper'):
-        print_status(f"Monthly limit reached ({tracker.limits['telegram_scraper']} calls).", "error")
-        return None
-    
-    peer = peer.lstrip('@')
+    peer = _strip_at(peer)
     print_status(f"Fetching entity: @{peer}", "paid")
-    url = f"https://telegram-scraper-api.p.rapidapi.com/entity/fetch?peer={peer}"
-    
-    headers = {
-        'x-rapidapi-host': 'telegram-scraper-api.p.rapidapi.com',
-        'x-rapidapi-key': rapidapi_key
-    }
-    
-    result = curl_request(url, headers)
-    if result:
-        tracker.increment('telegram_scraper')
-        print_status(f"API call recorded. Remaining: {tracker.get_remaining('telegram_scraper')}", "paid")
-    return result
+    url = _build_url(FETCH_ENTITY_URL, peer=peer)
+    return _paid_get(url, _scraper_headers(rapidapi_key), tracker)
 
 def fetch_full_user_info(peer: str, rapidapi_key: str, tracker: UsageTracker) -> Optional[Dict[Any, Any]]:
     """Fetch full user info [PAID]"""
-    if not tracker.can_use('telegram_scraper'):
-        print_status(f"Monthly limit reached ({tracker.limits['telegram_scraper']} calls).", "error")
-        return None
-    
-    peer = peer.lstrip('@')
+    peer = _strip_at(peer)
     print_status(f"Fetching full user info: @{peer}", "paid")
-    url = f"https://telegram-scraper-api.p.rapidapi.com/user/full?peer={peer}"
-    
-    headers = {
-        'x-rapidapi-host': 'telegram-scraper-api.p.rapidapi.com',
-        'x-rapidapi-key': rapidapi_key
-    }
-    
-    result = curl_request(url, headers)
-    if result:
-        tracker.increment('telegram_scraper')
-        print_status(f"API call recorded. Remaining: {tracker.get_remaining('telegram_scraper')}", "paid")
-    return result
+    url = _build_url(FETCH_FULL_USER_URL, peer=peer)
+    return _paid_get(url, _scraper_headers(rapidapi_key), tracker)
 
 def fetch_full_channel_info(peer: str, rapidapi_key: str, tracker: UsageTracker) -> Optional[Dict[Any, Any]]:
     """Fetch full channel info [PAID]"""
-    if not tracker.can_use('telegram_scraper'):
-        print_status(f"Monthly limit reached ({tracker.limits['telegram_scraper']} calls).", "error")
-        return None
-    
-    peer = peer.lstrip('@')
+    peer = _strip_at(peer)
     print_status(f"Fetching full channel info: @{peer}", "paid")
-    url = f"https://telegram-scraper-api.p.rapidapi.com/entity/fullchannel?peer={peer}"
-    
-    headers = {
-        'x-rapidapi-host': 'telegram-scraper-api.p.rapidapi.com',
-        'x-rapidapi-key': rapidapi_key
-    }
-    
-    result = curl_request(url, headers)
-    if result:
-        tracker.increment('telegram_scraper')
-        print_status(f"API call recorded. Remaining: {tracker.get_remaining('telegram_scraper')}", "paid")
-    return result
+    url = _build_url(FETCH_FULL_CHANNEL_URL, peer=peer)
+    return _paid_get(url, _scraper_headers(rapidapi_key), tracker)
 
 def search_user_by_phone(phone: str, rapidapi_key: str, tracker: UsageTracker) -> Optional[Dict[Any, Any]]:
     """Search user by phone number [PAID]"""
-    if not tracker.can_use('telegram_scraper'):
-        print_status(f"Monthly limit reached ({tracker.limits['telegram_scraper']} calls).", "error")
-        return None
-    
     print_status(f"Searching by phone: {phone}", "paid")
-    url = f"https://telegram-scraper-api.p.rapidapi.com/user/search-by-phone?phone={phone}"
-    
-    headers = {
-        'x-rapidapi-host': 'telegram-scraper-api.p.rapidapi.com',
-        'x-rapidapi-key': rapidapi_key
-    }
-    
-    result = curl_request(url, headers)
-    if result:
-        tracker.increment('telegram_scraper')
-        print_status(f"API call recorded. Remaining: {tracker.get_remaining('telegram_scraper')}", "paid")
-    return result
+    url = _build_url(SEARCH_BY_PHONE_URL, phone=phone)
+    return _paid_get(url, _scraper_headers(rapidapi_key), tracker)
 
 def fetch_online_users(peer: str, rapidapi_key: str, tracker: UsageTracker) -> Optional[Dict[Any, Any]]:
     """Fetch online users in a group [PAID]"""
-    if not tracker.can_use('telegram_scraper'):
-        print_status(f"Monthly limit reached ({tracker.limits['telegram_scraper']} calls).", "error")
-        return None
-    
-    peer = peer.lstrip('@')
+    peer = _strip_at(peer)
     print_status(f"Fetching online users: @{peer}", "paid")
-    url = f"https://telegram-scraper-api.p.rapidapi.com/entity/online?peer={peer}"
-    
-    headers = {
-        'x-rapidapi-host': 'telegram-scraper-api.p.rapidapi.com',
-        'x-rapidapi-key': rapidapi_key
-    }
-    
-    result = curl_request(url, headers)
-    if result:
-        tracker.increment('telegram_scraper')
-        print_status(f"API call recorded. Remaining: {tracker.get_remaining('telegram_scraper')}", "paid")
-    return result
+    url = _build_url(FETCH_ONLINE_URL, peer=peer)
+    return _paid_get(url, _scraper_headers(rapidapi_key), tracker, VOLATILE_CACHE_TTL)
 
 def fetch_stories(peer: str, rapidapi_key: str, tracker: UsageTracker, without_media: bool = False) -> Optional[Dict[Any, Any]]:
     """Fetch stories [PAID]"""
-    if not tracker.can_use('telegram_scraper'):
-        print_status(f"Monthly limit reached ({tracker.limits['telegram_scraper']} calls).", "error")
-        return None
-    
-    peer = peer.lstrip('@')
+    peer = _strip_at(peer)
     print_status(f"Fetching stories: @{peer}", "paid")
-    url = f"https://telegram-scraper-api.p.rapidapi.com/stories/fetch?peer={peer}&withoutMedia={'true' if without_media else 'false'}"
-    
-    headers = {
-        'x-rapidapi-host': 'telegram-scraper-api.p.rapidapi.com',
-        'x-rapidapi-key': rapidapi_key
-    }
-    
-    result = curl_request(url, headers)
-    if result:
-        tracker.increment('telegram_scraper')
-        print_status(f"API call recorded. Remaining: {tracker.get_remaining('telegram_scraper')}", "paid")
-    return result
+    url = _build_url(FETCH_STORIES_URL, peer=peer, withoutMedia='true' if without_media else 'false')
+    return _paid_get(url, _scraper_headers(rapidapi_key), tracker, VOLATILE_CACHE_TTL)
 
 def search_entities_paid(query: str, rapidapi_key: str, tracker: UsageTracker, limit: int = 10) -> Optional[Dict[Any, Any]]:
     """Search entities globally [PAID]"""
-    if not tracker.can_use('telegram_scraper'):
-        print_status(f"Monthly limit reached ({tracker.limits['telegram_scraper']} calls).", "error")
-        return None
-    
     print_status(f"Searching entities: {query}", "paid")
-    url = f"https://telegram-scraper-api.p.rapidapi.com/entity/search?q={query}&limit={limit}"
-    
-    headers = {
-        'x-rapidapi-host': 'telegram-scraper-api.p.rapidapi.com',
-        'x-rapidapi-key': rapidapi_key
+    url = _build_url(ENTITY_SEARCH_URL, q=query, limit=limit)
+    return _paid_get(url, _scraper_headers(rapidapi_key), tracker)
+
+def bulk_investigate(peer: str, rapidapi_key: str, tracker: UsageTracker) -> Optional[Dict[Any, Any]]:
+    """Run full user, full channel, stories and online users lookups concurrently [PAID]"""
+    target = _strip_at(peer)
+    # Same URLs the lookup functions build, so cached results can be left out of the quota check
+    lookups = {
+        'full_user_info': (fetch_full_user_info, _build_url(FETCH_FULL_USER_URL, peer=target)),
+        'full_channel_info': (fetch_full_channel_info, _build_url(FETCH_FULL_CHANNEL_URL, peer=target)),
+        'stories': (fetch_stories, _build_url(FETCH_STORIES_URL, peer=target, withoutMedia='false')),
+        'online_users': (fetch_online_users, _build_url(FETCH_ONLINE_URL, peer=target)),
     }
+    headers = _scraper_headers(rapidapi_key)
+    needed = sum(1 for _, url in lookups.values()
+                 if _CACHE.get(ResponseCache.make_key(url, headers)) is None)
+    if not tracker.can_use('telegram_scraper', needed):
+        print_status(f"Bulk investigation needs {needed} calls, {tracker.get_remaining('telegram_scraper')} remaining.", "error")
+        return None
     
-    result = curl_request(url, headers)
-    if result:
-        tracker.increment('telegram_scraper')
-        print_status(f"API call recorded. Remaining: {tracker.get_remaining('telegram_scraper')}", "paid")
-    return result
+    used_before = tracker.usage.get('telegram_scraper', 0)
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=len(lookups)) as executor:
+        futures = {name: executor.submit(_run_captured, name, fn, peer, rapidapi_key, tracker)
+                   for name, (fn, _) in lookups.items()}
+    results = {name: _future_result(future) for name, future in futures.items()}
+    used = max(tracker.usage.get('telegram_scraper', 0) - used_before, 0)
+    print_status(f"Bulk investigation used {used} API call(s). Remaining: {tracker.get_remaining('telegram_scraper')}", "paid")
+    return {name: result for name, result in results.items() if result} or None
 
 # ============================================================================
 # SEARCH MODES
@@ -489,17 +998,25 @@ def search_entities_paid(query: str, rapidapi_key: str, tracker: UsageTracker, l
 
 def free_search_all(target: str, rapidapi_channel_key: str, rapidapi_scraper_key: str):
     """Run all free APIs on target"""
-    print(f"\n{Colors.BOLD}{Colors.PURPLE}[FREE SEARCH - ALL FREE APIS]{Colors.ENDC}\n")
-    print(f"{Colors.BOLD}Target:{Colors.ENDC} {Colors.OKCYAN}{target}{Colors.ENDC}\n")
-    print(f"{Colors.HEADER}{'='*80}{Colors.ENDC}\n")
+    sys.stdout.write("\n".join([
+        f"\n{Colors.BOLD}{Colors.PURPLE}[FREE SEARCH - ALL FREE APIS]{Colors.ENDC}\n",
+        f"{Colors.BOLD}Target:{Colors.ENDC} {Colors.OKCYAN}{target}{Colors.ENDC}\n",
+        f"{Colors.HEADER}{'='*80}{Colors.ENDC}\n",
+    ]) + "\n")
     
     results = {}
     
+    # Lookups are independent: run them concurrently, then print in order
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        bot_future = executor.submit(_run_captured, "Bot ID lookup", get_bot_id, target)
+        channel_future = executor.submit(_run_captured, "Channel info", get_channel_info_free, target, rapidapi_channel_key) if rapidapi_channel_key else None
+        search_future = executor.submit(_run_captured, "Entity search", entity_search_free, target, rapidapi_scraper_key) if rapidapi_scraper_key else None
+    print()
+    
     # 1. Bot ID Lookup - Light Blue
-    print(f"{Colors.BOLD}{Colors.OKCYAN}╔═══════════════════════════════════════════════════════════════════════════════╗{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.OKCYAN}║{Colors.ENDC} {Colors.BOLD}1. Bot ID Lookup (BotsArchive){Colors.ENDC}                                           {Colors.BOLD}{Colors.OKCYAN}║{Colors.ENDC}")
-    print(f"{Colors.BOLD}{Colors.OKCYAN}╚═══════════════════════════════════════════════════════════════════════════════╝{Colors.ENDC}")
-    bot_result = get_bot_id(target)
+    print_box("1. Bot ID Lookup (BotsArchive)", Colors.OKCYAN)
+    bot_result = _future_result(bot_future)
     if bot_result:
         results['bot_id'] = bot_result
         print_json_colored(bot_result, Colors.OKCYAN)
@@ -509,10 +1026,8 @@ def free_search_all(target: str, rapidapi_channel_key: str, rapidapi_scraper_key
     
     # 2. Channel Info - Medium Blue
     if rapidapi_channel_key:
-        print(f"{Colors.BOLD}{Colors.OKBLUE}╔═══════════════════════════════════════════════════════════════════════════════╗{Colors.ENDC}")
-        print(f"{Colors.BOLD}{Colors.OKBLUE}║{Colors.ENDC} {Colors.BOLD}2. Channel Info (Telegram Channel API){Colors.ENDC}                                    {Colors.BOLD}{Colors.OKBLUE}║{Colors.ENDC}")
-        print(f"{Colors.BOLD}{Colors.OKBLUE}╚═══════════════════════════════════════════════════════════════════════════════╝{Colors.ENDC}")
-        channel_result = get_channel_info_free(target, rapidapi_channel_key)
+        print_box("2. Channel Info (Telegram Channel API)", Colors.OKBLUE)
+        channel_result = _future_result(channel_future)
         if channel_result:
             results['channel_info'] = channel_result
             print_json_colored(channel_result, Colors.OKBLUE)
@@ -525,10 +1040,8 @@ def free_search_all(target: str, rapidapi_channel_key: str, rapidapi_scraper_key
     
     # 3. Entity Search - Purple
     if rapidapi_scraper_key:
-        print(f"{Colors.BOLD}{Colors.PURPLE}╔═══════════════════════════════════════════════════════════════════════════════╗{Colors.ENDC}")
-        print(f"{Colors.BOLD}{Colors.PURPLE}║{Colors.ENDC} {Colors.BOLD}3. Entity Search (Telegram Scraper - Free tier){Colors.ENDC}                           {Colors.BOLD}{Colors.PURPLE}║{Colors.ENDC}")
-        print(f"{Colors.BOLD}{Colors.PURPLE}╚═══════════════════════════════════════════════════════════════════════════════╝{Colors.ENDC}")
-        search_result = entity_search_free(target, rapidapi_scraper_key)
+        print_box("3. Entity Search (Telegram Scraper - Free tier)", Colors.PURPLE)
+        search_result = _future_result(search_future)
         if search_result:
             results['entity_search'] = search_result
             print_json_colored(search_result, Colors.PURPLE)
@@ -539,6 +1052,30 @@ def free_search_all(target: str, rapidapi_channel_key: str, rapidapi_scraper_key
     
     return results
 
+@dataclass(frozen=True)
+class OpSpec:
+    """A paid menu operation: header, input prompts and the lookup to run"""
+    title: str
+    color: str
+    prompts: Tuple[str, ...]
+    fn: Callable[..., Optional[Dict[Any, Any]]]
+    box_color: Optional[str] = None  # Defaults to color
+    asks_limit: bool = False
+
+PAID_OPERATIONS = {
+    "1": OpSpec("CHECK PARTICIPANT STATUS", Colors.LIGHT_PURPLE,
+                ("Enter channel/group username", "Enter participant username"),
+                check_participant_status, box_color=Colors.PURPLE),
+    "2": OpSpec("FETCH ENTITY BY USERNAME", Colors.BLUE_PURPLE, ("Enter username",), fetch_entity_by_username),
+    "3": OpSpec("FETCH FULL USER INFO", Colors.OKBLUE, ("Enter username",), fetch_full_user_info),
+    "4": OpSpec("FETCH FULL CHANNEL INFO", Colors.OKCYAN, ("Enter channel username",), fetch_full_channel_info),
+    "5": OpSpec("SEARCH USER BY PHONE", Colors.DEEP_BLUE, ("Enter phone number (with country code)",), search_user_by_phone),
+    "6": OpSpec("FETCH ONLINE USERS", Colors.MAGENTA, ("Enter group username",), fetch_online_users),
+    "7": OpSpec("FETCH STORIES", Colors.VIOLET, ("Enter username",), fetch_stories),
+    "8": OpSpec("SEARCH ENTITIES", Colors.ROYAL_PURPLE, ("Enter search query",), search_entities_paid, asks_limit=True),
+    "9": OpSpec("BULK INVESTIGATE", Colors.HEADER, ("Enter username",), bulk_investigate),
+}
+
 def paid_operations_menu(rapidapi_scraper_key: str, tracker: UsageTracker):
     """Interactive paid operations menu"""
     
@@ -547,6 +1084,9 @@ def paid_operations_menu(rapidapi_scraper_key: str, tracker: UsageTracker):
         input(f"\n{Colors.GREY}Press Enter to continue...{Colors.ENDC}")
         return
     
+    # Handshake with the API while the user reads the menu and types a target
+    threading.Thread(target=_POOL.warm, args=(f"https://{SCRAPER_HOST}/",), daemon=True).start()
+    
     while True:
         print_paid_menu(tracker)
         
@@ -555,114 +1095,36 @@ def paid_operations_menu(rapidapi_scraper_key: str, tracker: UsageTracker):
         if choice == "0":
             break
         
-        elif choice == "1":
-            # Check Participant Status - Light Purple
-            print(f"\n{Colors.BOLD}{Colors.PURPLE}╔═══════════════════════════════════════════════════════════════════════════════╗{Colors.ENDC}")
-            print(f"{Colors.BOLD}{Colors.PURPLE}║{Colors.ENDC} {Colors.BOLD}CHECK PARTICIPANT STATUS{Colors.ENDC}                                                  {Colors.BOLD}{Colors.PURPLE}║{Colors.ENDC}")
-            print(f"{Colors.BOLD}{Colors.PURPLE}╚═══════════════════════════════════════════════════════════════════════════════╝{Colors.ENDC}\n")
-            peer = input(f"Enter channel/group username: ").strip()
-            participant = input(f"Enter participant username: ").strip()
-            if peer and participant:
-                result = check_participant_status(peer, participant, rapidapi_scraper_key, tracker)
-                if result:
-                    print_json_colored(result, '\033[38;5;141m')
-        
-        elif choice == "2":
-            # Fetch Entity by Username - Blue-Purple
-            print(f"\n{Colors.BOLD}\033[38;5;105m╔═══════════════════════════════════════════════════════════════════════════════╗{Colors.ENDC}")
-            print(f"{Colors.BOLD}\033[38;5;105m║{Colors.ENDC} {Colors.BOLD}FETCH ENTITY BY USERNAME{Colors.ENDC}                                                  {Colors.BOLD}\033[38;5;105m║{Colors.ENDC}")
-            print(f"{Colors.BOLD}\033[38;5;105m╚═══════════════════════════════════════════════════════════════════════════════╝{Colors.ENDC}\n")
-            peer = input(f"Enter username: ").strip()
-            if peer:
-                result = fetch_entity_by_username(peer, rapidapi_scraper_key, tracker)
-                if result:
-                    print_json_colored(result, '\033[38;5;105m')
-        
-        elif choice == "3":
-            # Fetch Full User Info - Medium Blue
-            print(f"\n{Colors.BOLD}{Colors.OKBLUE}╔═══════════════════════════════════════════════════════════════════════════════╗{Colors.ENDC}")
-            print(f"{Colors.BOLD}{Colors.OKBLUE}║{Colors.ENDC} {Colors.BOLD}FETCH FULL USER INFO{Colors.ENDC}                                                      {Colors.BOLD}{Colors.OKBLUE}║{Colors.ENDC}")
-            print(f"{Colors.BOLD}{Colors.OKBLUE}╚═══════════════════════════════════════════════════════════════════════════════╝{Colors.ENDC}\n")
-            peer = input(f"Enter username: ").strip()
-            if peer:
-                result = fetch_full_user_info(peer, rapidapi_scraper_key, tracker)
-                if result:
-                    print_json_colored(result, Colors.OKBLUE)
-        
-        elif choice == "4":
-            # Fetch Full Channel Info - Cyan
-            print(f"\n{Colors.BOLD}{Colors.OKCYAN}╔═══════════════════════════════════════════════════════════════════════════════╗{Colors.ENDC}")
-            print(f"{Colors.BOLD}{Colors.OKCYAN}║{Colors.ENDC} {Colors.BOLD}FETCH FULL CHANNEL INFO{Colors.ENDC}                                                   {Colors.BOLD}{Colors.OKCYAN}║{Colors.ENDC}")
-            print(f"{Colors.BOLD}{Colors.OKCYAN}╚═══════════════════════════════════════════════════════════════════════════════╝{Colors.ENDC}\n")
-            peer = input(f"Enter channel username: ").strip()
-            if peer:
-                result = fetch_full_channel_info(peer, rapidapi_scraper_key, tracker)
-                if result:
-                    print_json_colored(result, Colors.OKCYAN)
-        
-        elif choice == "5":
-            # Search User by Phone - Deep Blue
-            print(f"\n{Colors.BOLD}\033[38;5;27m╔═══════════════════════════════════════════════════════════════════════════════╗{Colors.ENDC}")
-            print(f"{Colors.BOLD}\033[38;5;27m║{Colors.ENDC} {Colors.BOLD}SEARCH USER BY PHONE{Colors.ENDC}                                                      {Colors.BOLD}\033[38;5;27m║{Colors.ENDC}")
-            print(f"{Colors.BOLD}\033[38;5;27m╚═══════════════════════════════════════════════════════════════════════════════╝{Colors.ENDC}\n")
-            phone = input(f"Enter phone number (with country code): ").strip()
-            if phone:
-                result = search_user_by_phone(phone, rapidapi_scraper_key, tracker)
-                if result:
-                    print_json_colored(result, '\033[38;5;27m')
-        
-        elif choice == "6":
-            # Fetch Online Users - Magenta
-            print(f"\n{Colors.BOLD}\033[38;5;170m╔═══════════════════════════════════════════════════════════════════════════════╗{Colors.ENDC}")
-            print(f"{Colors.BOLD}\033[38;5;170m║{Colors.ENDC} {Colors.BOLD}FETCH ONLINE USERS{Colors.ENDC}                                                        {Colors.BOLD}\033[38;5;170m║{Colors.ENDC}")
-            print(f"{Colors.BOLD}\033[38;5;170m╚═══════════════════════════════════════════════════════════════════════════════╝{Colors.ENDC}\n")
-            peer = input(f"Enter group username: ").strip()
-            if peer:
-                result = fetch_online_users(peer, rapidapi_scraper_key, tracker)
-                if result:
-                    print_json_colored(result, '\033[38;5;170m')
-        
-        elif choice == "7":
-            # Fetch Stories - Violet
-            print(f"\n{Colors.BOLD}\033[38;5;135m╔═══════════════════════════════════════════════════════════════════════════════╗{Colors.ENDC}")
-            print(f"{Colors.BOLD}\033[38;5;135m║{Colors.ENDC} {Colors.BOLD}FETCH STORIES{Colors.ENDC}                                                             {Colors.BOLD}\033[38;5;135m║{Colors.ENDC}")
-            print(f"{Colors.BOLD}\033[38;5;135m╚═══════════════════════════════════════════════════════════════════════════════╝{Colors.ENDC}\n")
-            peer = input(f"Enter username: ").strip()
-            if peer:
-                result = fetch_stories(peer, rapidapi_scraper_key, tracker)
-                if result:
-                    print_json_colored(result, '\033[38;5;135m')
-        
-        elif choice == "8":
-            # Search Entities - Royal Purple
-            print(f"\n{Colors.BOLD}\033[38;5;93m╔═══════════════════════════════════════════════════════════════════════════════╗{Colors.ENDC}")
-            print(f"{Colors.BOLD}\033[38;5;93m║{Colors.ENDC} {Colors.BOLD}SEARCH ENTITIES{Colors.ENDC}                                                           {Colors.BOLD}\033[38;5;93m║{Colors.ENDC}")
-            print(f"{Colors.BOLD}\033[38;5;93m╚═══════════════════════════════════════════════════════════════════════════════╝{Colors.ENDC}\n")
-            query = input(f"Enter search query: ").strip()
-            limit = input(f"Number of results [default: 10]: ").strip()
-            limit = int(limit) if limit else 10
-            if query:
-                result = search_entities_paid(query, rapidapi_scraper_key, tracker, limit)
-                if result:
-                    print_json_colored(result, '\033[38;5;93m')
-        
-        else:
+        spec = PAID_OPERATIONS.get(choice)
+        if spec is None:
             print_status("Invalid option", "error")
+        else:
+            _write_screen("\n", _box_block(spec.title, spec.box_color or spec.color), "\n")
+            args = [input(f"{prompt}: ").strip() for prompt in spec.prompts]
+            kwargs = {}
+            if spec.asks_limit:
+                # One call returns up to limit results, so larger searches cost no extra quota
+                kwargs['limit'] = _parse_limit(input(f"Number of results [default: 10]: ").strip())
+            if all(args):
+                result = spec.fn(*args, rapidapi_scraper_key, tracker, **kwargs)
+                if result:
+                    print_json_colored(result, spec.color)
         
         input(f"\n{Colors.GREY}Press Enter to continue...{Colors.ENDC}")
         print("\n" * 2)
 
 def configure_api_keys(config: ConfigManager):
     """Interactive API key configuration"""
-    print(f"\n{Colors.BOLD}{Colors.PURPLE}[API KEY CONFIGURATION]{Colors.ENDC}\n")
-    print(f"Configure your RapidAPI keys for Telegram intelligence gathering.\n")
-    print(f"{Colors.BOLD}Available APIs:{Colors.ENDC}")
-    print(f"  1. Telegram Channel API (Free tier - basic channel info)")
-    print(f"  2. Telegram Scraper API (15 free calls/month - advanced features)\n")
-    
-    print(f"{Colors.OKGREEN}Get your keys at:{Colors.ENDC}")
-    print(f"  • https://rapidapi.com/akrakoro-akrakoro-default/api/telegram-channel")
-    print(f"  • https://rapidapi.com/nyansterowo/api/telegram-scraper-api\n")
+    sys.stdout.write("\n".join([
+        f"\n{Colors.BOLD}{Colors.PURPLE}[API KEY CONFIGURATION]{Colors.ENDC}\n",
+        "Configure your RapidAPI keys for Telegram intelligence gathering.\n",
+        f"{Colors.BOLD}Available APIs:{Colors.ENDC}",
+        "  1. Telegram Channel API (Free tier - basic channel info)",
+        "  2. Telegram Scraper API (15 free calls/month - advanced features)\n",
+        f"{Colors.OKGREEN}Get your keys at:{Colors.ENDC}",
+        "  • https://rapidapi.com/akrakoro-akrakoro-default/api/telegram-channel",
+        "  • https://rapidapi.com/nyansterowo/api/telegram-scraper-api\n",
+    ]) + "\n")
     
     # Telegram Channel API
     current_channel = config.get_api_key('rapidapi_channel_key')
@@ -703,48 +1165,51 @@ def configure_api_keys(config: ConfigManager):
 
 def view_config_status(config: ConfigManager):
     """Display configuration status"""
-    print(f"\n{Colors.BOLD}{Colors.PURPLE}[CONFIGURATION STATUS]{Colors.ENDC}\n")
+    lines = [f"\n{Colors.BOLD}{Colors.PURPLE}[CONFIGURATION STATUS]{Colors.ENDC}\n"]
     
     channel_key = config.get_api_key('rapidapi_channel_key')
     scraper_key = config.get_api_key('rapidapi_scraper_key')
     
     if channel_key:
-        print(f"{Colors.OKGREEN}✓{Colors.ENDC} Telegram Channel API: Configured ({channel_key[:20]}...)")
+        lines.append(f"{Colors.OKGREEN}✓{Colors.ENDC} Telegram Channel API: Configured ({channel_key[:20]}...)")
     else:
-        print(f"{Colors.FAIL}✗{Colors.ENDC} Telegram Channel API: Not configured")
+        lines.append(f"{Colors.FAIL}✗{Colors.ENDC} Telegram Channel API: Not configured")
     
     if scraper_key:
-        print(f"{Colors.OKGREEN}✓{Colors.ENDC} Telegram Scraper API: Configured ({scraper_key[:20]}...)")
+        lines.append(f"{Colors.OKGREEN}✓{Colors.ENDC} Telegram Scraper API: Configured ({scraper_key[:20]}...)")
     else:
-        print(f"{Colors.FAIL}✗{Colors.ENDC} Telegram Scraper API: Not configured")
+        lines.append(f"{Colors.FAIL}✗{Colors.ENDC} Telegram Scraper API: Not configured")
     
-    print(f"\n{Colors.GREY}Config file: {CONFIG_FILE}{Colors.ENDC}")
+    lines.append(f"\n{Colors.GREY}Config file: {CONFIG_FILE}{Colors.ENDC}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def view_usage_stats(tracker: UsageTracker):
     """Display usage statistics"""
-    print(f"\n{Colors.BOLD}{Colors.PURPLE}[USAGE STATISTICS]{Colors.ENDC}\n")
-    print(f"{Colors.BOLD}Month:{Colors.ENDC} {tracker.usage.get('month', 'N/A')}\n")
-    
-    print(f"{Colors.BOLD}Telegram Scraper API (PAID):{Colors.ENDC}")
     used = tracker.usage.get('telegram_scraper', 0)
     limit = tracker.limits['telegram_scraper']
-    remaining = limit - used
+    remaining = max(limit - used, 0)
     percentage = (used / limit) * 100
     
     # Progress bar
     bar_length = 40
-    filled = int(bar_length * used / limit)
+    filled = min(int(bar_length * used / limit), bar_length)
     bar = '█' * filled + '░' * (bar_length - filled)
     
     color = Colors.OKGREEN if remaining > 5 else Colors.WARNING if remaining > 2 else Colors.FAIL
     
-    print(f"  Used: {color}{used}{Colors.ENDC}/{limit}")
-    print(f"  Remaining: {color}{remaining}{Colors.ENDC}")
-    print(f"  {bar} {color}{percentage:.1f}%{Colors.ENDC}\n")
+    out = (f"\n{Colors.BOLD}{Colors.PURPLE}[USAGE STATISTICS]{Colors.ENDC}\n\n"
+           f"{Colors.BOLD}Month:{Colors.ENDC} {tracker.usage.get('month', 'N/A')}\n\n"
+           f"{Colors.BOLD}Telegram Scraper API (PAID):{Colors.ENDC}\n"
+           f"  Used: {color}{used}{Colors.ENDC}/{limit}\n"
+           f"  Remaining: {color}{remaining}{Colors.ENDC}\n"
+           f"  {bar} {color}{percentage:.1f}%{Colors.ENDC}\n\n")
     
     if remaining == 0:
-        next_month = datetime.now().replace(day=1, month=datetime.now().month % 12 + 1)
-        print(f"{Colors.FAIL}⚠️  LIMIT REACHED - Resets on {next_month.strftime('%Y-%m-01')}{Colors.ENDC}\n")
+        now = datetime.now()
+        reset = f"{now.year + now.month // 12}-{now.month % 12 + 1:02d}-01"
+        out += f"{Colors.FAIL}⚠️  LIMIT REACHED - Resets on {reset}{Colors.ENDC}\n\n"
+    
+    sys.stdout.write(out)
 
 def main():
     """Main application loop"""
@@ -804,6 +1269,11 @@ def main():
                 else:
                     print_status("Reset cancelled", "info")
             
+            elif choice == "X":
+                # Clear Response Cache
+                removed = _CACHE.clear()
+                print_status(f"Cleared {removed} cached responses from {CACHE_FILE}", "success")
+            
             else:
                 print_status("Invalid option", "error")
             